@@ -6,6 +6,7 @@ import numpy
 import chainerx
 
 
+@functools.lru_cache(maxsize=None)
 def total_size(shape):
     return functools.reduce(operator.mul, shape, 1)
 
@@ -33,11 +34,10 @@ def uniform(shape, dtype, low=None, high=None, *, random_state=numpy.random):
 
 def shaped_arange(shape, dtype):
     size = total_size(shape)
-    a = numpy.arange(1, size + 1).reshape(shape)
     dtype = numpy.dtype(dtype)
     if dtype == numpy.bool_:
-        return a % 2 == 0
-    return a.astype(dtype, copy=False)
+        return numpy.arange(1, size + 1).reshape(shape) % 2 == 0
+    return numpy.arange(1, size + 1, dtype=dtype).reshape(shape)
 
 
 # TODO(beam2d): Think better way to make multiple different arrays
@@ -48,16 +48,16 @@ def create_dummy_ndarray(
 
     if dtype in ('bool', 'bool_'):
         if pattern == 1:
-            data = [i % 2 == 1 for i in range(size)]
+            data = numpy.arange(size) % 2 == 1
         else:
-            data = [i % 3 == 0 for i in range(size)]
+            data = numpy.arange(size) % 3 == 0
     else:
         if start is None:
             if dtype in chainerx.testing.unsigned_dtypes:
                 start = 0 if pattern == 1 else 1
             else:
                 start = -1 if pattern == 1 else -2
-        data = list(range(start, size + start))
+        data = numpy.arange(start, size + start)
 
     if padding is True:
         padding = 1
@@ -65,7 +65,7 @@ def create_dummy_ndarray(
         padding = 0
 
     # Unpadded array
-    a_unpad = numpy.array(data, dtype=dtype).reshape(shape)
+    a_unpad = data.astype(dtype, copy=False).reshape(shape)
 
     if padding == 0:
         a_np = a_unpad
@@ -151,7 +151,7 @@ _shapes_as_sequence_or_int = (
     + [0, 1, 5])
 
 
-@pytest.fixture(params=_shapes)
+@pytest.fixture(params=_shapes, ids=[str(s) for s in _shapes])
 def shape(request):
     return request.param
 
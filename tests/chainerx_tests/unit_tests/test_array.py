@@ -1,5 +1,6 @@
 import copy
 import math
+import operator
 import pickle
 
 import numpy
@@ -100,25 +101,14 @@ def test_cast_scalar(device, value, shape, dtype):
 @pytest.mark.parametrize('shape', [
     (0,), (1, 0), (2,), (1, 2), (2, 3),
 ])
+@pytest.mark.parametrize('cast', [
+    float, int, bool, operator.methodcaller('item'),
+], ids=['float', 'int', 'bool', 'item'])
 @pytest.mark.parametrize_device(['native:0', 'cuda:0'])
-def test_cast_scalar_invalid(device, shape):
-    dtype = chainerx.float32
-
-    a = chainerx.ones(shape, dtype)
+def test_cast_scalar_invalid(device, shape, cast):
+    a = chainerx.ones(shape, chainerx.float32)
     with pytest.raises(chainerx.DimensionError):
-        float(a)
-
-    a = chainerx.ones(shape, dtype)
-    with pytest.raises(chainerx.DimensionError):
-        int(a)
-
-    a = chainerx.ones(shape, dtype)
-    with pytest.raises(chainerx.DimensionError):
-        bool(a)
-
-    a = chainerx.ones(shape, dtype)
-    with pytest.raises(chainerx.DimensionError):
-        a.item()
+        cast(a)
 
 
 def test_to_device():
@@ -182,7 +172,7 @@ def test_view(shape, dtype):
     # inplace modification
     if array.size > 0:
         array *= array
-        assert array._debug_flat_data == view._debug_flat_data
+        chainerx.testing.assert_array_equal_ex(view, array)
 
 
 def test_view_must_not_share_properties():
@@ -389,9 +379,20 @@ def test_array_repr_expired_backprop_id():
             'backprop_ids=[\'<expired>\'])' == str(array))
 
 
+@pytest.fixture(scope='module')
+def array_template():
+    return chainerx.array([1., 1., 1.], chainerx.float32)
+
+
+@pytest.fixture(scope='module')
+def grad_template():
+    return chainerx.array([0.5, 0.5, 0.5], chainerx.float32)
+
+
 @pytest.mark.parametrize('backprop_args', [(None,), ()])
-def test_array_require_grad_without_backprop_id(backprop_args):
-    array = chainerx.array([1, 1, 1], chainerx.float32)
+def test_array_require_grad_without_backprop_id(
+        array_template, backprop_args):
+    array = array_template.copy()
 
     assert not array.is_grad_required(*backprop_args)
     assert not array.is_backprop_required(*backprop_args)
@@ -408,8 +409,8 @@ def test_array_require_grad_without_backprop_id(backprop_args):
     assert array.is_backprop_required(chainerx.anygraph)
 
 
-def test_array_require_grad_with_backprop_id():
-    array = chainerx.array([1, 1, 1], chainerx.float32)
+def test_array_require_grad_with_backprop_id(array_template):
+    array = array_template.copy()
 
     with chainerx.backprop_scope('bp1') as bp1:
         assert not array.is_backprop_required(bp1)
@@ -438,9 +439,10 @@ def test_array_require_grad_with_backprop_id():
 
 
 @pytest.mark.parametrize('backprop_args', [(None,), ()])
-def test_array_grad_without_backprop_id(backprop_args):
-    array = chainerx.array([1., 1., 1.], chainerx.float32)
-    grad = chainerx.array([0.5, 0.5, 0.5], chainerx.float32)
+def test_array_grad_without_backprop_id(
+        array_template, grad_template, backprop_args):
+    array = array_template.copy()
+    grad = grad_template.copy()
 
     with pytest.raises(chainerx.ChainerxError):
         array.get_grad(*backprop_args)
@@ -452,16 +454,16 @@ def test_array_grad_without_backprop_id(backprop_args):
     # Gradient methods
     array.require_grad().set_grad(grad, *backprop_args)
     assert array.get_grad(*backprop_args) is not None
-    assert array.get_grad(
-        *backprop_args)._debug_flat_data == grad._debug_flat_data
+    chainerx.testing.assert_array_equal_ex(
+        array.get_grad(*backprop_args), grad)
 
     array.cleargrad(*backprop_args)  # clear
     assert array.get_grad(*backprop_args) is None
 
     array.set_grad(grad, *backprop_args)
     assert array.get_grad(*backprop_args) is not None
-    assert array.get_grad(
-        *backprop_args)._debug_flat_data == grad._debug_flat_data
+    chainerx.testing.assert_array_equal_ex(
+        array.get_grad(*backprop_args), grad)
 
     array.set_grad(None, *backprop_args)  # clear
     assert array.get_grad(*backprop_args) is None
@@ -475,9 +477,9 @@ def test_array_grad_without_backprop_id(backprop_args):
     assert array.get_grad(*backprop_args) is None
 
 
-def test_array_grad_with_backprop_id():
-    array = chainerx.array([1., 1., 1.], chainerx.float32)
-    grad = chainerx.array([0.5, 0.5, 0.5], chainerx.float32)
+def test_array_grad_with_backprop_id(array_template, grad_template):
+    array = array_template.copy()
+    grad = grad_template.copy()
 
     with chainerx.backprop_scope('bp1') as bp1:
         with pytest.raises(chainerx.ChainerxError):
@@ -489,7 +491,7 @@ def test_array_grad_with_backprop_id():
 
         array.require_grad(bp1).set_grad(grad, bp1)
         assert array.get_grad(bp1) is not None
-        assert array.get_grad(bp1)._debug_flat_data == grad._debug_flat_data
+        chainerx.testing.assert_array_equal_ex(array.get_grad(bp1), grad)
 
         array.cleargrad(bp1)  # clear
         assert array.get_grad(bp1) is None
@@ -506,9 +508,9 @@ def test_array_grad_with_backprop_id():
         array.require_grad(backprop_id=bp2).set_grad(grad, backprop_id=bp2)
         assert array.get_grad(bp2) is not None
         assert array.get_grad(backprop_id=bp2) is not None
-        assert array.get_grad(bp2)._debug_flat_data == grad._debug_flat_data
-        assert array.get_grad(
-            backprop_id=bp2)._debug_flat_data == grad._debug_flat_data
+        chainerx.testing.assert_array_equal_ex(array.get_grad(bp2), grad)
+        chainerx.testing.assert_array_equal_ex(
+            array.get_grad(backprop_id=bp2), grad)
 
         array.cleargrad(backprop_id=bp2)  # clear
         assert array.get_grad(bp2) is None
@@ -528,8 +530,9 @@ def test_array_grad_no_deepcopy():
     grad2 = array.get_grad()
 
     grad1 *= chainerx.array([2, 2, 2], dtype)
-    assert grad2._debug_flat_data == [
-        10, 14, 16], 'grad getter must not incur a copy'
+    chainerx.testing.assert_array_equal(
+        grad2, numpy.array([10, 14, 16], dtype),
+        err_msg='grad getter must not incur a copy')
 
 
 def test_array_cleargrad():
@@ -546,13 +549,14 @@ def test_array_cleargrad():
     array.cleargrad()
     assert array.get_grad() is None
 
-    assert saved_grad._debug_flat_data == [
-        5, 7, 8], 'Clearing grad must not affect previously retrieved grad'
+    chainerx.testing.assert_array_equal(
+        saved_grad, numpy.array([5, 7, 8], dtype),
+        err_msg='Clearing grad must not affect previously retrieved grad')
 
 
-def test_array_grad_identity():
-    array = chainerx.array([1., 1., 1.], chainerx.float32)
-    grad = chainerx.array([0.5, 0.5, 0.5], chainerx.float32)
+def test_array_grad_identity(array_template, grad_template):
+    array = array_template.copy()
+    grad = grad_template.copy()
     array.require_grad().set_grad(grad)
 
     assert array.get_grad() is grad, (
@@ -562,18 +566,20 @@ def test_array_grad_identity():
 
     # array.grad and grad share the same data
     grad += chainerx.array([2, 2, 2], chainerx.float32)
-    assert array.get_grad()._debug_flat_data == [
-        2.5, 2.5, 2.5], 'A modification to grad must affect array.grad'
+    chainerx.testing.assert_array_equal(
+        array.get_grad(), numpy.array([2.5, 2.5, 2.5], chainerx.float32),
+        err_msg='A modification to grad must affect array.grad')
 
     array_grad = array.get_grad()
     array_grad += chainerx.array([1, 1, 1], chainerx.float32)
-    assert grad._debug_flat_data == [
-        3.5, 3.5, 3.5], 'A modification to array.grad must affect grad'
+    chainerx.testing.assert_array_equal(
+        grad, numpy.array([3.5, 3.5, 3.5], chainerx.float32),
+        err_msg='A modification to array.grad must affect grad')
 
 
-def test_array_require_grad_multiple_graphs_forward():
-    x1 = chainerx.array([1, 1, 1], chainerx.float32)
-    x2 = chainerx.array([1, 1, 1], chainerx.float32)
+def test_array_require_grad_multiple_graphs_forward(array_template):
+    x1 = array_template.copy()
+    x2 = array_template.copy()
 
     with chainerx.backprop_scope('bp1') as bp1, \
             chainerx.backprop_scope('bp2') as bp2, \
@@ -670,7 +676,9 @@ def test_array_to_numpy_identity(device, slice1, slice2):
         start1:end1:step1, start2:end2:step2]
     y = chainerx.array(x)
     z = chainerx.to_numpy(y)
-    chainerx.testing.assert_array_equal_ex(x, y, strides_check=False)
+    # z is the NumPy conversion of y, so comparing x and z also covers the
+    # values of y without converting it again.
+    assert y.dtype == x.dtype
     chainerx.testing.assert_array_equal_ex(x, z, strides_check=False)
 
 
@@ -686,7 +694,8 @@ def test_asarray_to_numpy_identity(device, slice1, slice2):
         start1:end1:step1, start2:end2:step2]
     y = chainerx.asarray(x)
     z = chainerx.to_numpy(y)
-    chainerx.testing.assert_array_equal_ex(x, y)
+    assert y.dtype == x.dtype
+    assert y.strides == x.strides
     chainerx.testing.assert_array_equal_ex(x, z, strides_check=False)
 
 